@@ -2,58 +2,77 @@
 Command line interface for AcronymCreator.
 """
 
-import click
-from .core import AcronymCreator, AcronymOptions
-
-
-@click.command()
-@click.argument("phrase", required=True)
-@click.option(
-    "--include-articles",
-    is_flag=True,
-    default=False,
-    help="Include articles (a, an, the) in the acronym",
-)
-@click.option(
-    "--min-length",
-    type=int,
-    default=2,
-    help="Minimum word length to include (default: 2)",
-)
-@click.option("--max-words", type=int, help="Maximum number of words to process")
-@click.option(
-    "--lowercase", is_flag=True, default=False, help="Output acronym in lowercase"
-)
-@click.version_option(version="0.1.0", prog_name="acronymcreator")
-def main(phrase, include_articles, min_length, max_words, lowercase):
-    """Generate acronyms from phrases.
-
-    PHRASE: The phrase to create an acronym from
-
-    Examples:
-
-        acronymcreator "The Quick Brown Fox"
-
-        acronymcreator "Application Programming Interface" --include-articles
-
-        acronymcreator "Very Long Phrase With Many Words" --max-words 3
-    """
-    creator = AcronymCreator()
+import argparse
+import sys
+from typing import List, Optional
+
+from .core import AcronymOptions, create_basic_acronym
+
+DESCRIPTION = "Generate acronyms from phrases."
+
+EPILOG = """Examples:
+
+    acronymcreator "The Quick Brown Fox"
+
+    acronymcreator "Application Programming Interface" --include-articles
+
+    acronymcreator "Very Long Phrase With Many Words" --max-words 3"""
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the acronymcreator command."""
+    parser = argparse.ArgumentParser(
+        prog="acronymcreator",
+        description=DESCRIPTION,
+        epilog=EPILOG,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "phrase", metavar="PHRASE", help="The phrase to create an acronym from"
+    )
+    parser.add_argument(
+        "--include-articles",
+        action="store_true",
+        help="Include articles (a, an, the) in the acronym",
+    )
+    parser.add_argument(
+        "--min-length",
+        type=int,
+        default=2,
+        help="Minimum word length to include (default: 2)",
+    )
+    parser.add_argument(
+        "--max-words", type=int, help="Maximum number of words to process"
+    )
+    parser.add_argument(
+        "--lowercase", action="store_true", help="Output acronym in lowercase"
+    )
+    parser.add_argument(
+        "--version", action="version", version="acronymcreator, version 0.1.0"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the acronymcreator command and return its exit code."""
+    args = build_parser().parse_args(argv)
+
     options = AcronymOptions(
-        include_articles=include_articles,
-        min_word_length=min_length,
-        max_words=max_words,
-        force_uppercase=not lowercase,
+        include_articles=args.include_articles,
+        min_word_length=args.min_length,
+        max_words=args.max_words,
+        force_uppercase=not args.lowercase,
     )
 
-    result = creator.create_basic_acronym(phrase, options)
+    result = create_basic_acronym(args.phrase, options)
 
     if result:
-        click.echo(result)
-    else:
-        click.echo("No acronym could be generated from the given phrase.", err=True)
-        raise click.Abort()
+        sys.stdout.write(result + "\n")
+        return 0
+
+    print("No acronym could be generated from the given phrase.", file=sys.stderr)
+    return 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
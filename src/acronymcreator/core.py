@@ -2,12 +2,37 @@
 Core functionality for AcronymCreator.
 """
 
-import re
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
 
+_VOWELS = frozenset("aeiouAEIOU")
 
-@dataclass
+# dataclass(slots=True) is only supported from Python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _PunctuationTable(dict):
+    """Translation table deleting everything but word characters and whitespace.
+
+    Entries are filled in lazily on first lookup so the full Unicode range
+    never has to be materialised up front.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        keep = char.isalnum() or char == "_" or char.isspace()
+        value = codepoint if keep else None
+        self[codepoint] = value
+        return value
+
+
+_PUNCT_TABLE = _PunctuationTable()
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AcronymOptions:
     """Configuration options for acronym generation."""
 
@@ -17,11 +42,9 @@ class AcronymOptions:
     force_uppercase: bool = True
 
 
-class AcronymCreator:
-    """Main class for creating acronyms from phrases."""
-
-    # Common articles and prepositions to potentially exclude
-    COMMON_WORDS = {
+# Common articles and prepositions to potentially exclude
+COMMON_WORDS = frozenset(
+    {
         "a",
         "an",
         "the",
@@ -43,135 +66,184 @@ class AcronymCreator:
         "through",
         "during",
     }
+)
 
-    def create_basic_acronym(self, phrase: str, options: AcronymOptions) -> str:
-        """Create a basic acronym by taking first letters."""
-        if not phrase.strip():
-            return ""
+# COMMON_WORDS in lower, title and upper case so most words can be checked
+# without allocating a lowercased copy
+_COMMON_WORDS_ALL_CASES = (
+    COMMON_WORDS
+    | {word.capitalize() for word in COMMON_WORDS}
+    | {word.upper() for word in COMMON_WORDS}
+)
 
-        # Use the extract_words method to get filtered words
-        words = self.extract_words(phrase, options)
 
-        # Limit number of words if max_words is specified
-        if options.max_words is not None:
-            words = words[: options.max_words]
+@lru_cache(maxsize=4096)
+def create_basic_acronym(phrase: str, options: AcronymOptions) -> str:
+    """Create a basic acronym by taking first letters.
 
-        acronym = "".join(word[0] for word in words)
+    Results are cached per (phrase, options) pair, so options must be
+    hashable; use ``create_basic_acronym.cache_clear()`` to reset the cache.
+    """
+    if not phrase or phrase.isspace():
+        return ""
 
-        if options.force_uppercase:
-            acronym = acronym.upper()
+    words = _extract_words_limited(phrase, options, options.max_words)
 
-        return acronym
+    # Uppercase each letter as it is taken rather than copying the result
+    if options.force_uppercase:
+        return "".join([word[0].upper() for word in words])
 
-    def clean_phrase(self, phrase: str) -> str:
-        """Clean a phrase by removing special characters and normalizing whitespace."""
-        # Remove special characters and punctuation, keep only letters,
-        # numbers, and spaces
-        cleaned = re.sub(r"[^\w\s]", "", phrase)
+    return "".join([word[0] for word in words])
 
-        # Normalize whitespace - replace multiple spaces with single space and strip
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
 
-        return cleaned
+def create_basic_acronyms(phrases: Iterable[str], options: AcronymOptions) -> List[str]:
+    """Create basic acronyms for many phrases sharing the same options."""
+    return [create_basic_acronym(phrase, options) for phrase in phrases]
 
-    def extract_words(self, phrase: str, options: AcronymOptions) -> list:
-        """Extract words from a phrase based on the given options."""
-        if not phrase.strip():
-            return []
 
-        # Clean the phrase first
-        cleaned_phrase = self.clean_phrase(phrase)
-        words = cleaned_phrase.split()
+def clean_phrase(phrase: str) -> str:
+    """Clean a phrase by removing special characters and normalizing whitespace."""
+    return " ".join(_split_phrase(phrase))
 
-        # Filter out articles and common words if requested
-        if not options.include_articles:
-            words = [word for word in words if word.lower() not in self.COMMON_WORDS]
 
-        # Filter by minimum word length if specified
-        words = [word for word in words if len(word) >= options.min_word_length]
+def _split_phrase(phrase: str) -> List[str]:
+    """Split a phrase into words with special characters removed.
 
+    Word extraction uses this directly rather than joining a cleaned phrase
+    only to split it again.
+    """
+    # Fast path: when every word is alphanumeric there is nothing to remove,
+    # and the split needed anyway doubles as the check
+    words = phrase.split()
+    if all(map(str.isalnum, words)):
         return words
 
-    def create_syllable_acronym(self, phrase: str, options: AcronymOptions) -> str:
-        """Create a syllable-based acronym by taking syllables from each word."""
-        if not phrase.strip():
-            return ""
-
-        words = self.extract_words(phrase, options)
-
-        # Limit number of words if max_words is specified
-        if options.max_words is not None:
-            words = words[: options.max_words]
-
-        syllables = []
-        for word in words:
-            # Syllable extraction: create 2-3 character syllables
-            if len(word) <= 2:
-                syllables.append(word)
-            elif len(word) <= 4:
-                # Short words: take first 2 characters
-                syllables.append(word[:2])
-            else:
-                # Longer words: take first 2-3 characters based on vowel patterns
-                vowels = "aeiouAEIOU"
-                if word[0] in vowels:
-                    # Word starts with vowel: take 3 chars
-                    syllables.append(word[:3])
-                elif len(word) >= 5 and word[1] in vowels:
-                    # Second char is vowel: take first 3 chars
-                    syllables.append(word[:3])
-                else:
-                    # Default: take first 2 chars
-                    syllables.append(word[:2])
-
-        acronym = "".join(syllables)
-
-        if options.force_uppercase:
-            acronym = acronym.upper()
-
-        return acronym
-
-    def generate_multiple_options(self, phrase: str, count: int = 4) -> dict:
-        """Generate multiple acronym options using different strategies."""
-        if not phrase.strip():
-            return {"basic": [], "with_articles": [], "creative": [], "syllable": []}
-
-        results = {}
-
-        # Basic acronym (excludes articles)
-        basic_options = AcronymOptions(include_articles=False)
-        basic_result = self.create_basic_acronym(phrase, basic_options)
-        results["basic"] = [basic_result] if basic_result else []
-
-        # With articles
-        with_articles_options = AcronymOptions(include_articles=True)
-        with_articles_result = self.create_basic_acronym(phrase, with_articles_options)
-        results["with_articles"] = (
-            [with_articles_result] if with_articles_result else []
+    # Remove special characters and punctuation; split() collapses whitespace
+    return phrase.translate(_PUNCT_TABLE).split()
+
+
+def extract_words(phrase: str, options: AcronymOptions) -> list:
+    """Extract words from a phrase based on the given options."""
+    return list(_extract_words_limited(phrase, options))
+
+
+def _extract_words_limited(
+    phrase: str, options: AcronymOptions, max_words: Optional[int] = None
+) -> Iterator[str]:
+    """Lazily extract filtered words, stopping once max_words have been found.
+
+    Words beyond the limit are never lowercased or checked against
+    COMMON_WORDS.
+    """
+    # Bind lookups to locals so the filter loop avoids global and attribute access
+    common = COMMON_WORDS
+    common_all_cases = _COMMON_WORDS_ALL_CASES
+    min_length = options.min_word_length
+    include_articles = options.include_articles
+
+    # Filter by minimum length and, if requested, articles and common words.
+    # A title-case word missing from common_all_cases cannot be a common word,
+    # so only other mixed-case words need lowercasing.
+    words = (
+        word
+        for word in _split_phrase(phrase)
+        if len(word) >= min_length
+        and (
+            include_articles
+            or (
+                word not in common_all_cases
+                and (word.istitle() or word.lower() not in common)
+            )
         )
+    )
+    if max_words is None:
+        return words
+    return islice(words, max(max_words, 0))
 
-        # Creative variations (different word limits, case options)
-        creative_results = []
-        if basic_result:
-            # Lowercase version
-            lowercase_options = AcronymOptions(
-                include_articles=False, force_uppercase=False
-            )
-            lowercase_result = self.create_basic_acronym(phrase, lowercase_options)
-            if lowercase_result.lower() != basic_result.lower():
-                creative_results.append(lowercase_result)
 
-            # Limited words version
-            limited_options = AcronymOptions(include_articles=False, max_words=3)
-            limited_result = self.create_basic_acronym(phrase, limited_options)
-            if limited_result and limited_result != basic_result:
-                creative_results.append(limited_result)
+def create_syllable_acronym(phrase: str, options: AcronymOptions) -> str:
+    """Create a syllable-based acronym by taking syllables from each word."""
+    if not phrase or phrase.isspace():
+        return ""
+
+    words = _extract_words_limited(phrase, options, options.max_words)
+
+    # Words of up to 4 characters contribute their first 2 characters (or
+    # the whole word); longer words contribute 3 when either of the first
+    # two characters is a vowel
+    syllables = [
+        (
+            word[:3]
+            if len(word) > 4 and (word[0] in _VOWELS or word[1] in _VOWELS)
+            else word[:2]
+        )
+        for word in words
+    ]
+
+    acronym = "".join(syllables)
+
+    if options.force_uppercase:
+        acronym = acronym.upper()
+
+    return acronym
+
+
+def generate_multiple_options(phrase: str, count: int = 4) -> dict:
+    """Generate multiple acronym options using different strategies."""
+    if not phrase or phrase.isspace():
+        return {"basic": [], "with_articles": [], "creative": [], "syllable": []}
+
+    results = {}
+
+    # Basic acronym (excludes articles)
+    basic_options = AcronymOptions(include_articles=False)
+    basic_result = create_basic_acronym(phrase, basic_options)
+    results["basic"] = [basic_result] if basic_result else []
+
+    # With articles
+    with_articles_options = AcronymOptions(include_articles=True)
+    with_articles_result = create_basic_acronym(phrase, with_articles_options)
+    results["with_articles"] = [with_articles_result] if with_articles_result else []
+
+    # Creative variations (different word limits, case options)
+    creative_results = []
+    if basic_result:
+        # Lowercase version
+        lowercase_options = AcronymOptions(
+            include_articles=False, force_uppercase=False
+        )
+        lowercase_result = create_basic_acronym(phrase, lowercase_options)
+        if lowercase_result.lower() != basic_result.lower():
+            creative_results.append(lowercase_result)
+
+        # Limited words version
+        limited_options = AcronymOptions(include_articles=False, max_words=3)
+        limited_result = create_basic_acronym(phrase, limited_options)
+        if limited_result and limited_result != basic_result:
+            creative_results.append(limited_result)
+
+    results["creative"] = creative_results
+
+    # Syllable-based
+    syllable_options = AcronymOptions(include_articles=False)
+    syllable_result = create_syllable_acronym(phrase, syllable_options)
+    results["syllable"] = [syllable_result] if syllable_result else []
+
+    return results
+
+
+class AcronymCreator:
+    """Main class for creating acronyms from phrases.
 
-        results["creative"] = creative_results
+    Kept for backwards compatibility: the methods are the stateless
+    module-level functions.
+    """
 
-        # Syllable-based
-        syllable_options = AcronymOptions(include_articles=False)
-        syllable_result = self.create_syllable_acronym(phrase, syllable_options)
-        results["syllable"] = [syllable_result] if syllable_result else []
+    COMMON_WORDS = COMMON_WORDS
 
-        return results
+    create_basic_acronym = staticmethod(create_basic_acronym)
+    create_basic_acronyms = staticmethod(create_basic_acronyms)
+    clean_phrase = staticmethod(clean_phrase)
+    extract_words = staticmethod(extract_words)
+    create_syllable_acronym = staticmethod(create_syllable_acronym)
+    generate_multiple_options = staticmethod(generate_multiple_options)
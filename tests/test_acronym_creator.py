@@ -2,7 +2,16 @@
 Tests for the Acronym Creator application.
 """
 
-from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.acronymcreator.core import (
+    AcronymCreator,
+    AcronymOptions,
+    create_basic_acronym,
+    extract_words,
+)
 
 
 class TestAcronymCreator:
@@ -40,6 +49,13 @@ class TestAcronymCreator:
         result = self.creator.create_basic_acronym(phrase, options)
         assert result == ""
 
+    def test_create_basic_acronym_whitespace_phrase(self):
+        """Test handling of a whitespace-only phrase."""
+        phrase = " \t\n "
+        options = AcronymOptions()
+        assert self.creator.create_basic_acronym(phrase, options) == ""
+        assert self.creator.extract_words(phrase, options) == []
+
     def test_create_basic_acronym_single_word(self):
         """Test acronym creation from single word."""
         phrase = "Python"
@@ -68,6 +84,20 @@ class TestAcronymCreator:
         result = self.creator.create_basic_acronym(phrase, options)
         assert result == "OTT"
 
+    def test_create_basic_acronym_max_words_zero(self):
+        """Test a zero word limit produces an empty acronym."""
+        phrase = "One Two Three"
+        options = AcronymOptions(max_words=0)
+        result = self.creator.create_basic_acronym(phrase, options)
+        assert result == ""
+
+    def test_create_basic_acronyms_batch(self):
+        """Test batch acronym creation preserves input order."""
+        phrases = ["Hello World", "", "The Quick Brown Fox"]
+        options = AcronymOptions()
+        results = self.creator.create_basic_acronyms(phrases, options)
+        assert results == ["HW", "", "QBF"]
+
     def test_clean_phrase_special_characters(self):
         """Test phrase cleaning removes special characters."""
         phrase = "Hello, World! How are you?"
@@ -80,6 +110,12 @@ class TestAcronymCreator:
         cleaned = self.creator.clean_phrase(phrase)
         assert cleaned == "Hello World"
 
+    def test_clean_phrase_keeps_unicode_and_underscores(self):
+        """Test phrase cleaning keeps non-ASCII letters and underscores."""
+        phrase = "Café — snake_case\tnaïve!"
+        cleaned = self.creator.clean_phrase(phrase)
+        assert cleaned == "Café snake_case naïve"
+
     def test_extract_words_basic(self):
         """Test word extraction from phrase."""
         phrase = "Hello Beautiful World"
@@ -94,6 +130,13 @@ class TestAcronymCreator:
         words = self.creator.extract_words(phrase, options)
         assert words == ["Quick", "Brown", "Fox"]
 
+    def test_extract_words_filter_articles_any_case(self):
+        """Test articles are filtered regardless of their case."""
+        phrase = "THE Quick tHe Brown the Fox"
+        options = AcronymOptions(include_articles=False)
+        words = self.creator.extract_words(phrase, options)
+        assert words == ["Quick", "Brown", "Fox"]
+
     def test_extract_words_min_length(self):
         """Test word extraction with minimum length filter."""
         phrase = "A Big Red Car"
@@ -108,6 +151,20 @@ class TestAcronymCreator:
         result = self.creator.create_syllable_acronym(phrase, options)
         assert result == "PYPRLAN"  # Py-Pr-Lan based on syllable logic
 
+    def test_create_syllable_acronym_vowel_patterns(self):
+        """Test syllable lengths for vowel-led and short words."""
+        phrase = "Orange Jam Ox Strong"
+        options = AcronymOptions()
+        result = self.creator.create_syllable_acronym(phrase, options)
+        assert result == "ORAJAOXST"
+
+    def test_create_syllable_acronym_max_words(self):
+        """Test syllable-based acronym creation honours the word limit."""
+        phrase = "Python Programming Language"
+        options = AcronymOptions(max_words=2)
+        result = self.creator.create_syllable_acronym(phrase, options)
+        assert result == "PYPR"
+
     def test_generate_multiple_options(self):
         """Test generation of multiple acronym options."""
         phrase = "The Quick Brown Fox"
@@ -124,3 +181,43 @@ class TestAcronymCreator:
 
         # Check with articles (should include 'The')
         assert "TQBF" in results["with_articles"]
+
+
+class TestModuleFunctions:
+    """Test cases for the module-level acronym functions."""
+
+    def test_create_basic_acronym_function(self):
+        """Test the module-level function matches the class method."""
+        options = AcronymOptions()
+        result = create_basic_acronym("The Quick Brown Fox", options)
+        assert result == AcronymCreator().create_basic_acronym(
+            "The Quick Brown Fox", options
+        )
+        assert result == "QBF"
+
+    def test_extract_words_function(self):
+        """Test word extraction without an AcronymCreator instance."""
+        options = AcronymOptions(include_articles=True)
+        assert extract_words("The Quick Fox", options) == ["The", "Quick", "Fox"]
+
+    def test_create_basic_acronym_cached(self):
+        """Test repeated calls with equal options are served from the cache."""
+        create_basic_acronym.cache_clear()
+        create_basic_acronym("Hello World", AcronymOptions())
+        create_basic_acronym("Hello World", AcronymOptions())
+        info = create_basic_acronym.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestAcronymOptions:
+    """Test cases for the AcronymOptions dataclass."""
+
+    def test_options_are_immutable(self):
+        """Test options cannot be modified after creation."""
+        options = AcronymOptions()
+        with pytest.raises(FrozenInstanceError):
+            options.max_words = 3
+
+    def test_options_are_hashable(self):
+        """Test equal options hash the same."""
+        assert hash(AcronymOptions(max_words=3)) == hash(AcronymOptions(max_words=3))
@@ -2,56 +2,69 @@
 Tests for the CLI module.
 """
 
-from click.testing import CliRunner
+import pytest
+
 from src.acronymcreator.cli import main
 
 
 class TestCLI:
     """Test cases for the CLI interface."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
-    def test_cli_basic_acronym(self):
+    def test_cli_basic_acronym(self, capsys):
         """Test basic CLI functionality."""
-        result = self.runner.invoke(main, ["Hello World"])
-        assert result.exit_code == 0
-        assert result.output.strip() == "HW"
+        exit_code = main(["Hello World"])
+        assert exit_code == 0
+        assert capsys.readouterr().out.strip() == "HW"
 
-    def test_cli_with_articles_excluded(self):
+    def test_cli_with_articles_excluded(self, capsys):
         """Test CLI with articles excluded by default."""
-        result = self.runner.invoke(main, ["The Quick Brown Fox"])
-        assert result.exit_code == 0
-        assert result.output.strip() == "QBF"
+        exit_code = main(["The Quick Brown Fox"])
+        assert exit_code == 0
+        assert capsys.readouterr().out.strip() == "QBF"
 
-    def test_cli_with_articles_included(self):
+    def test_cli_with_articles_included(self, capsys):
         """Test CLI with articles included."""
-        result = self.runner.invoke(main, ["The Quick Brown Fox", "--include-articles"])
-        assert result.exit_code == 0
-        assert result.output.strip() == "TQBF"
+        exit_code = main(["The Quick Brown Fox", "--include-articles"])
+        assert exit_code == 0
+        assert capsys.readouterr().out.strip() == "TQBF"
 
-    def test_cli_lowercase_output(self):
+    def test_cli_lowercase_output(self, capsys):
         """Test CLI with lowercase output."""
-        result = self.runner.invoke(main, ["hello world", "--lowercase"])
-        assert result.exit_code == 0
-        assert result.output.strip() == "hw"
+        exit_code = main(["hello world", "--lowercase"])
+        assert exit_code == 0
+        assert capsys.readouterr().out.strip() == "hw"
 
-    def test_cli_empty_phrase(self):
+    def test_cli_max_words(self, capsys):
+        """Test CLI with a word limit."""
+        exit_code = main(["Very Long Phrase With Many Words", "--max-words", "3"])
+        assert exit_code == 0
+        assert capsys.readouterr().out.strip() == "VLP"
+
+    def test_cli_empty_phrase(self, capsys):
         """Test CLI with empty phrase that produces no result."""
-        result = self.runner.invoke(main, [""])
-        assert result.exit_code == 1
-        assert "No acronym could be generated" in result.output
+        exit_code = main([""])
+        assert exit_code == 1
+        assert "No acronym could be generated" in capsys.readouterr().err
 
-    def test_cli_help(self):
+    def test_cli_help(self, capsys):
         """Test CLI help output."""
-        result = self.runner.invoke(main, ["--help"])
-        assert result.exit_code == 0
-        assert "Generate acronyms from phrases" in result.output
-        assert "PHRASE" in result.output
+        with pytest.raises(SystemExit) as excinfo:
+            main(["--help"])
+        assert excinfo.value.code == 0
+        output = capsys.readouterr().out
+        assert "Generate acronyms from phrases" in output
+        assert "PHRASE" in output
 
-    def test_cli_version(self):
+    def test_cli_version(self, capsys):
         """Test CLI version output."""
-        result = self.runner.invoke(main, ["--version"])
-        assert result.exit_code == 0
-        assert "0.1.0" in result.output
+        with pytest.raises(SystemExit) as excinfo:
+            main(["--version"])
+        assert excinfo.value.code == 0
+        assert "0.1.0" in capsys.readouterr().out
+
+    def test_cli_invalid_option(self, capsys):
+        """Test CLI rejects a non-integer minimum length."""
+        with pytest.raises(SystemExit) as excinfo:
+            main(["Hello World", "--min-length", "abc"])
+        assert excinfo.value.code == 2
+        assert "--min-length" in capsys.readouterr().err